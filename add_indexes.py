@@ -0,0 +1,20 @@
+from dotenv import load_dotenv
+load_dotenv()
+from sqlalchemy import inspect
+from models import engine, Base
+
+# create_all only builds indexes together with new tables; this adds any that are missing on existing ones
+print("Creating missing indexes...")
+inspector = inspect(engine)
+is_postgres = engine.dialect.name == "postgresql"
+# CREATE INDEX CONCURRENTLY doesn't block writes on PostgreSQL but can't run inside a transaction
+with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        for index in table.indexes:
+            if is_postgres:
+                index.dialect_kwargs["postgresql_concurrently"] = True
+            index.create(bind=conn, checkfirst=True)
+            print(f" - {table.name}.{index.name}")
+print("Indexes up to date.")
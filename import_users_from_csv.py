@@ -5,6 +5,8 @@ import os
 # Add current directory to path so we can import models
 sys.path.append(os.getcwd())
 
+from sqlalchemy import or_
+
 from models import SessionLocal, User
 
 def import_users(csv_path: str):
@@ -15,33 +17,45 @@ def import_users(csv_path: str):
             return
 
         with open(csv_path, mode='r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            count = 0
-            for row in reader:
-                # Check validation/existence
-                emp_id = row.get("emp_id")
-                emp_email = row.get("emp_email")
-                
-                existing = db.query(User).filter((User.emp_id == emp_id) | (User.emp_email == emp_email)).first()
-                if existing:
-                    print(f"Skipping {row.get('emp_name')} ({emp_id}) - Already exists.")
-                    continue
-
-                user = User(
-                    emp_name=row.get("emp_name"),
-                    emp_id=emp_id,
-                    emp_email=emp_email,
-                    emp_phone=row.get("emp_phone"),
-                    emp_designation=row.get("emp_designation"),
-                    emp_department=row.get("emp_department"),
-                    emp_hierarchy=row.get("emp_hierarchy")
-                )
-                db.add(user)
-                count += 1
-            
-            db.commit()
-            print(f"Successfully added {count} users.")
-            
+            rows = list(csv.DictReader(f))
+
+        # Fetch all existing emp_ids/emails in a single query
+        ids = {row.get("emp_id") for row in rows}
+        emails = {row.get("emp_email") for row in rows}
+        existing = db.query(User.emp_id, User.emp_email).filter(
+            or_(User.emp_id.in_(ids), User.emp_email.in_(emails))
+        ).all()
+        seen_ids = {r.emp_id for r in existing}
+        seen_emails = {r.emp_email for r in existing}
+
+        new_users = []
+        for row in rows:
+            # Check validation/existence
+            emp_id = row.get("emp_id")
+            emp_email = row.get("emp_email")
+
+            if emp_id in seen_ids or emp_email in seen_emails:
+                print(f"Skipping {row.get('emp_name')} ({emp_id}) - Already exists.")
+                continue
+            seen_ids.add(emp_id)
+            seen_emails.add(emp_email)
+
+            new_users.append({
+                "emp_name": row.get("emp_name"),
+                "emp_id": emp_id,
+                "emp_email": emp_email,
+                "emp_phone": row.get("emp_phone"),
+                "emp_designation": row.get("emp_designation"),
+                "emp_department": row.get("emp_department"),
+                "emp_hierarchy": row.get("emp_hierarchy"),
+            })
+
+        if new_users:
+            db.bulk_insert_mappings(User, new_users)
+        count = len(new_users)
+        db.commit()
+        print(f"Successfully added {count} users.")
+
     except Exception as e:
         print(f"Error importing users: {e}")
         db.rollback()
@@ -1,15 +1,21 @@
+import asyncio
 import logging
 import secrets
-from typing import Generator, Optional
-from fastapi import FastAPI, Depends, HTTPException, Header, Body, UploadFile, File, Request
+import time
+from dataclasses import fields
+from datetime import date, datetime
+from typing import AsyncGenerator, Optional, get_args
+from fastapi import FastAPI, Depends, HTTPException, Header, Body, UploadFile, File, Request, Query
 from fastapi.responses import JSONResponse
 import csv
 import io
-import codecs
 from fastapi import status
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from utils import response
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import func, lambda_stmt, or_, select, text
+from sqlalchemy.exc import IntegrityError
+from utils import ORJSONResponse, response
 from dotenv import load_dotenv
 
 # Load env vars first so models.py can see DATABASE_URL
@@ -18,17 +24,27 @@ load_dotenv()
 from models import (
      User as UserModel,
      Task as TaskModel,
-     SessionLocal,
+     AsyncSessionLocal,
      init_db,
+     check_db_connection,
+     RUN_MIGRATIONS,
      UserCreate,
      UserRead,
+     UserReadFast,
      UserUpdate,
      TaskCreate,
+     TaskUpdate,
      TaskRead,
+     TaskReadFast,
+     TaskStatus,
+     TaskPriority,
      Foundation,
+     bulk_insert,
+     bulk_insert_users,
  )
+from redis_client import get_redis_client, ping_redis, get_value, set_value, delete_value, get_members, set_members, delete_matching, incr_value
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -66,19 +82,45 @@ def get_rank(designation: str) -> int:
     # Default to 0 if unknown designation
     if not designation:
         return 0
-    # Create a normalized lookup (case-insensitive)
-    return HIERARCHY_RANKS.get(designation.upper(), 0)
-
-def validate_manager_hierarchy(db, manager_id: str, employee_designation: str, employee_id: Optional[str] = None):
+    # Designations are usually stored upper-case, so try them as-is before normalizing (case-insensitive)
+    rank = HIERARCHY_RANKS.get(designation)
+    if rank is None:
+        rank = HIERARCHY_RANKS.get(designation.upper(), 0)
+    return rank
+
+# Hot-path lookups as lambda statements: SQLAlchemy caches them by the lambda's code,
+# so repeated calls skip rebuilding the statement and its cache key
+def user_by_emp_id(emp_id: str):
+    return lambda_stmt(lambda: select(UserModel).where(UserModel.emp_id == emp_id))
+
+def designation_by_emp_id(emp_id: str):
+    # Only the column the rank checks need; a missing user comes back as no row
+    return lambda_stmt(lambda: select(UserModel.emp_designation).where(UserModel.emp_id == emp_id))
+
+def foundation_by_emp_id(emp_id: str):
+    return lambda_stmt(lambda: select(Foundation).where(Foundation.emp_id == emp_id))
+
+def foundation_by_token(token: str):
+    return lambda_stmt(lambda: select(Foundation).where(Foundation.token == token))
+
+def user_by_emp_id_and_token(emp_id: str, token: str):
+    # The user, only while the token is still the one stored for them (logout/rotation revoke it in the DB)
+    return lambda_stmt(lambda: select(UserModel).join(Foundation, Foundation.emp_id == UserModel.emp_id).where(
+        UserModel.emp_id == emp_id, Foundation.token == token
+    ))
+
+async def validate_manager_hierarchy(db, manager_id: str, employee_designation: str, employee_id: Optional[str] = None):
     """
     Validates if the manager exists and has a higher rank than the employee.
     Allows self-management for Rank >= 5.
     """
-    manager = db.query(UserModel).filter(UserModel.emp_id == manager_id).first()
+    manager = (await db.execute(designation_by_emp_id(manager_id))).first()
     if not manager:
         raise HTTPException(status_code=400, detail=f"Manager with ID {manager_id} not found")
-        
-    manager_rank = get_rank(manager.emp_designation)
+    return check_manager_rank(manager_id, manager.emp_designation, employee_designation, employee_id)
+
+def check_manager_rank(manager_id: str, manager_designation: str, employee_designation: str, employee_id: Optional[str] = None):
+    manager_rank = get_rank(manager_designation)
     employee_rank = get_rank(employee_designation)
     
     # Check for Self-Management first
@@ -90,33 +132,102 @@ def validate_manager_hierarchy(db, manager_id: str, employee_designation: str, e
 
     # Standard Hierarchy Check: Manager must be strictly higher
     if manager_rank <= employee_rank:
-         raise HTTPException(status_code=400, detail=f"Invalid Hierarchy: Manager ({manager.emp_designation}) must be higher rank than Employee ({employee_designation})")
+         raise HTTPException(status_code=400, detail=f"Invalid Hierarchy: Manager ({manager_designation}) must be higher rank than Employee ({employee_designation})")
     
     return True
 
-def get_all_subordinates(db, manager_emp_id: str) -> set:
+async def validate_manager_hierarchy_batch(db, pairs: list, pending: Optional[dict] = None) -> list:
+    """
+    Batch form of validate_manager_hierarchy for (manager_id, employee_designation, employee_id) tuples.
+    Loads every manager in one query; `pending` maps emp_id -> designation for users not inserted yet.
+    Returns the error detail for each pair, or None where the pair is valid.
+    """
+    manager_ids = {manager_id for manager_id, _, _ in pairs}
+    managers = dict((await db.execute(
+        select(UserModel.emp_id, UserModel.emp_designation).where(UserModel.emp_id.in_(manager_ids))
+    )).all())
+    for emp_id, designation in (pending or {}).items():
+        managers.setdefault(emp_id, designation)
+
+    errors = []
+    for manager_id, employee_designation, employee_id in pairs:
+        if manager_id not in managers:
+            errors.append(f"Manager with ID {manager_id} not found")
+            continue
+        try:
+            check_manager_rank(manager_id, managers[manager_id], employee_designation, employee_id)
+            errors.append(None)
+        except HTTPException as e:
+            errors.append(e.detail)
+    return errors
+
+# How long a login token stays cached in Redis (seconds)
+TOKEN_CACHE_TTL = 86400
+# How long a computed view scope stays cached in Redis (seconds)
+SCOPE_CACHE_TTL = 300
+
+# manager_id -> direct reports for the whole org, kept per worker and reloaded whenever
+# the hierarchy version counter in Redis moves (bumped on every user write), or once it is
+# older than SCOPE_CACHE_TTL so writes that missed the bump still show up
+HIERARCHY_VERSION_KEY = "hierarchy:version"
+_children_map: dict = {}
+_children_version = None
+_children_loaded_at = 0.0
+
+async def get_children_map(db) -> Optional[dict]:
+    global _children_map, _children_version, _children_loaded_at
+    version = await get_value(HIERARCHY_VERSION_KEY)
+    if version is None:
+        # Redis down or counter not created yet; callers fall back to the database
+        await incr_value(HIERARCHY_VERSION_KEY)
+        return None
+    now = time.monotonic()
+    if version != _children_version or now - _children_loaded_at > SCOPE_CACHE_TTL:
+        children = {}
+        for emp_id, manager_id in await db.execute(select(UserModel.emp_id, UserModel.manager_id)):
+            if manager_id:
+                children.setdefault(manager_id, []).append(emp_id)
+        _children_map, _children_version, _children_loaded_at = children, version, now
+    return _children_map
+
+async def get_all_subordinates(db, manager_emp_id: str) -> set:
     """
-    Recursively finds all subordinates (direct and indirect) for a given manager.
+    Finds all subordinates (direct and indirect) for a given manager.
+    Walks the cached children map when available, otherwise runs one recursive CTE.
     Returns a set of emp_ids.
     """
-    subordinates = set()
-    # Find direct reports
-    direct_reports = db.query(UserModel).filter(UserModel.manager_id == manager_emp_id).all()
-    
-    for user in direct_reports:
-        subordinates.add(user.emp_id)
-        # Recursively find their subordinates
-        subordinates.update(get_all_subordinates(db, user.emp_id))
-        
-    return subordinates
+    children = await get_children_map(db)
+    if children is not None:
+        subordinates = set()
+        frontier = [manager_emp_id]
+        while frontier:
+            reports = [r for m in frontier for r in children.get(m, ()) if r not in subordinates]
+            subordinates.update(reports)
+            frontier = reports
+    else:
+        subs = (
+            select(UserModel.emp_id)
+            .where(UserModel.manager_id == manager_emp_id)
+            .cte("subs", recursive=True)
+        )
+        # UNION (not UNION ALL) drops rows already seen, so manager_id cycles terminate
+        subs = subs.union(select(UserModel.emp_id).join(subs, UserModel.manager_id == subs.c.emp_id))
+        subordinates = set(await db.scalars(select(subs.c.emp_id)))
 
+    # A self-managed root shows up in its own result
+    subordinates.discard(manager_emp_id)
     return subordinates
 
-def get_user_view_scope(db, emp_id: str) -> set:
+async def get_user_view_scope(db, emp_id: str) -> set:
     """
     Returns the set of emp_ids that the given emp_id is allowed to see (Self + Subordinates).
+    Cached in Redis under scope:{emp_id}; user writes clear the cache.
     """
-    user = db.query(UserModel).filter(UserModel.emp_id == emp_id).first()
+    cached = await get_members(f"scope:{emp_id}")
+    if cached:
+        return cached
+
+    user = (await db.execute(designation_by_emp_id(emp_id))).first()
     if not user:
         return set()
     
@@ -125,8 +236,9 @@ def get_user_view_scope(db, emp_id: str) -> set:
     
     # If rank is high enough, include subordinates
     if rank >= 2:
-        scope.update(get_all_subordinates(db, emp_id))
-        
+        scope.update(await get_all_subordinates(db, emp_id))
+
+    await set_members(f"scope:{emp_id}", scope, SCOPE_CACHE_TTL)
     return scope
 
 def validate_assignee_eligibility(user: UserModel):
@@ -142,12 +254,32 @@ def validate_assignee_eligibility(user: UserModel):
         )
     return True
 
-def get_db() -> Generator:
-     db = SessionLocal()
-     try:
+def json_body(model):
+    """
+    Dependency that parses and validates the raw request body in one model_validate_json pass,
+    instead of json.loads followed by validation of the resulting dict.
+    """
+    async def parse(request: Request):
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            errors = []
+            for err in e.errors(include_url=False):
+                err["loc"] = ("body", *err["loc"])
+                # Invalid JSON reports the raw bytes, which the 422 handler can't encode if they aren't UTF-8
+                if isinstance(err.get("input"), bytes):
+                    err["input"] = err["input"].decode("utf-8", errors="replace")
+                errors.append(err)
+            raise RequestValidationError(errors)
+    return parse
+
+def json_body_docs(model) -> dict:
+    # The body is no longer a declared parameter, so describe it in the OpenAPI schema explicitly
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": model.model_json_schema()}}}}
+
+async def get_db() -> AsyncGenerator:
+     async with AsyncSessionLocal() as db:
          yield db
-     finally:
-         db.close()
 
 # Auth Models and Dependency
 class LoginRequest(BaseModel):
@@ -159,77 +291,110 @@ class RegisterRequest(BaseModel):
     emp_email: str
     password: str
 
-def verify_token(authorization: Optional[str] = Header(None), db=Depends(get_db)):
+def strip_token_prefix(authorization: str) -> str:
+    # Slice off the scheme instead of replace(), which scans and copies the whole header
+    if authorization[:7] == "Bearer ":
+        return authorization[7:]
+    if authorization[:6] == "Token ":
+        return authorization[6:]
+    return authorization
+
+async def verify_token(authorization: Optional[str] = Header(None), db=Depends(get_db)):
     if not authorization:
          raise HTTPException(status_code=401, detail="Missing Authorization Header")
     
-    if authorization.startswith("Bearer "):
-        token = authorization.replace("Bearer ", "")
-    elif authorization.startswith("Token "):
-        token = authorization.replace("Token ", "")
-    else:
-        token = authorization
-        
-    foundation_entry = db.query(Foundation).filter(Foundation.token == token).first()
+    token = strip_token_prefix(authorization)
+
+    # Token -> emp_id cached at login; a hit loads the user in one query that still checks the stored token,
+    # so a cache entry that outlives a logout or rotation doesn't authenticate
+    emp_id = await get_value(f"tok:{token}")
+    if emp_id:
+        user = await db.scalar(user_by_emp_id_and_token(emp_id, token))
+        if not user:
+            raise HTTPException(status_code=401, detail="Invalid or Expired Token")
+        return user
+
+    foundation_entry = await db.scalar(foundation_by_token(token))
     if not foundation_entry:
          raise HTTPException(status_code=401, detail="Invalid or Expired Token")
 
-    user = db.query(UserModel).filter(UserModel.emp_id == foundation_entry.emp_id).first()
+    user = await db.scalar(user_by_emp_id(foundation_entry.emp_id))
     
     if not user:
         raise HTTPException(status_code=401, detail="User associated with token not found")
     
     return user
 
+async def get_view_scope(current_user=Depends(verify_token), db=Depends(get_db)) -> set:
+    """
+    View scope of the authenticated user as a dependency, so it is resolved once per request.
+    """
+    return await get_user_view_scope(db, current_user.emp_id)
+
 
-from redis_client import get_redis_client
+async def invalidate_hierarchy_caches():
+    global _children_version
+    # A hierarchy change can affect every ancestor's scope, so drop them all
+    await delete_matching("scope:*")
+    # Makes every worker reload its children map on next use
+    if await incr_value(HIERARCHY_VERSION_KEY) is None:
+        # Bump failed: at least this worker reloads; the others catch up once their map ages out
+        _children_version = None
 
-@app.on_event("startup")
-def on_startup():
-    # Initialize Postgres tables
-    init_db()
-    
-    # Verify Redis Connection
-    redis_conn = get_redis_client()
-    if redis_conn:
+async def evict_token(token: Optional[str]):
+    # verify_token re-checks the DB on a cache hit, so a stale entry left behind here can't authenticate
+    if token and not await delete_value(f"tok:{token}"):
+        logger.warning("Could not evict a revoked token from the Redis cache")
+
+async def check_redis_connection():
+    if await ping_redis():
         logger.info("Redis connected successfully")
     else:
         logger.warning("Redis connection failed")
 
+@app.on_event("startup")
+async def on_startup():
+    # Initialize Postgres tables only in migration runs; regular workers just check connectivity
+    if RUN_MIGRATIONS:
+        await init_db()
+    else:
+        await check_db_connection()
+    
+    # One shared asyncio client per worker; it owns its connection pool
+    app.state.redis = get_redis_client()
+    # Verify Redis Connection in the background so the worker starts serving right away
+    app.state.redis_check = asyncio.create_task(check_redis_connection())
 
-def get_redis():
-    r = get_redis_client()
-    try:
-        yield r
-    finally:
-        # Redis client manages its own connection pool, but we can close it if needed.
-        # usually for redis-py usage in dependency, we just yield it.
-        pass
+
+def get_redis(request: Request):
+    # Shared client set up at startup
+    return request.app.state.redis
 
 
 @app.get('/')
-def welcome():
+async def welcome():
      return response(status.HTTP_200_OK, message="Welcome to the Automation Backend")
 
 
 @app.post('/login', status_code=200)
-def login(login_req: LoginRequest, db=Depends(get_db)):
+async def login(login_req: LoginRequest, db=Depends(get_db)):
     # Check Foundation for password
-    foundation = db.query(Foundation).filter(Foundation.emp_id == login_req.emp_id).first()
+    foundation = await db.scalar(foundation_by_emp_id(login_req.emp_id))
     
     # If not found or password mismatch (simple string match for now as per implied task simplicity, usually hash)
     if not foundation or foundation.password != login_req.password:
          raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
-    user = db.query(UserModel).filter(UserModel.emp_id == login_req.emp_id).first()
+    user = await db.scalar(user_by_emp_id(login_req.emp_id))
     if not user:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User details not found")
     
-    token = secrets.token_hex(16)
+    token = secrets.token_urlsafe(16)
+    previous_token = foundation.token
     foundation.token = token
-    db.commit()
+    await db.commit()
     
-    user_data = UserRead.from_orm(user).dict()
+    user_data = UserRead.from_orm_trusted(user).model_dump()
     # Remove token/password if present? UserRead doesn't have password, Foundation has.
     # UserRead might have 'token' field if not updated properly in models, but we removed it or it is optional traverse.
     # Note: UserRead no longer has 'token' populated from User model since we removed it from User model.
@@ -237,6 +402,10 @@ def login(login_req: LoginRequest, db=Depends(get_db)):
     if "token" in user_data:
         del user_data["token"]
 
+    # The new token replaces the old one, so drop the old cache entry too
+    await evict_token(previous_token)
+    await set_value(f"tok:{token}", user.emp_id, TOKEN_CACHE_TTL)
+
     data = {
         "token": token,
         "userData": user_data
@@ -245,20 +414,21 @@ def login(login_req: LoginRequest, db=Depends(get_db)):
 
 
 @app.post('/register', status_code=200)
-def register(reg_req: RegisterRequest, db=Depends(get_db)):
+async def register(reg_req: RegisterRequest, db=Depends(get_db)):
     # 1. Verify User Exists with matching emp_id and email
-    user = db.query(UserModel).filter(
+    user = await db.scalar(select(UserModel).where(
         UserModel.emp_id == reg_req.emp_id, 
         UserModel.emp_email == reg_req.emp_email
-    ).first()
+    ))
     
     if not user:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User validation failed. Invalid ID or Email.")
 
     # 2. Check/Create Foundation Entry
-    foundation = db.query(Foundation).filter(Foundation.emp_id == reg_req.emp_id).first()
+    foundation = await db.scalar(foundation_by_emp_id(reg_req.emp_id))
     
-    token = secrets.token_hex(16)
+    token = secrets.token_urlsafe(16)
+    previous_token = None
     
     if foundation:
         # Check if already registered (password changed from default)
@@ -266,6 +436,7 @@ def register(reg_req: RegisterRequest, db=Depends(get_db)):
             raise HTTPException(status_code=400, detail="User already registered. Kindly login.")
             
         # If entry exists (default pwd), update password and token
+        previous_token = foundation.token
         foundation.password = reg_req.password
         foundation.token = token
     else:
@@ -277,12 +448,15 @@ def register(reg_req: RegisterRequest, db=Depends(get_db)):
         )
         db.add(foundation)
     
-    db.commit()
+    await db.commit()
     
     # 3. Return Response (Same as Login)
-    user_data = UserRead.from_orm(user).dict()
+    user_data = UserRead.from_orm_trusted(user).model_dump()
     if "token" in user_data:
         del user_data["token"]
+
+    await evict_token(previous_token)
+    await set_value(f"tok:{token}", user.emp_id, TOKEN_CACHE_TTL)
         
     data = {
         "token": token,
@@ -291,40 +465,36 @@ def register(reg_req: RegisterRequest, db=Depends(get_db)):
     return response(status.HTTP_200_OK, message="Registration successful", data=data)
 
 @app.post('/logout', status_code=200)
-def logout(authorization: Optional[str] = Header(None), db=Depends(get_db)):
+async def logout(authorization: Optional[str] = Header(None), db=Depends(get_db)):
     if not authorization:
         # If no token, just say logged out or error? Usually success if already "gone" logic, but checking token is safer.
         return response(status.HTTP_401_UNAUTHORIZED, message="Missing Token")
 
-    if authorization.startswith("Bearer "):
-        token = authorization.replace("Bearer ", "")
-    elif authorization.startswith("Token "):
-        token = authorization.replace("Token ", "")
-    else:
-        token = authorization
+    token = strip_token_prefix(authorization)
 
-    foundation = db.query(Foundation).filter(Foundation.token == token).first()
+    await evict_token(token)
+    foundation = await db.scalar(foundation_by_token(token))
     
     if foundation:
         foundation.token = None # Mark as null/expired
-        db.commit()
+        await db.commit()
     
     return response(status.HTTP_200_OK, message="Logout successful")
 
 
-@app.post('/user', status_code=201)
-def create_user(user: UserCreate, db=Depends(get_db)):
-     # Check uniqueness by emp_id
-     existing = db.query(UserModel).filter(UserModel.emp_id == user.emp_id).first()
-     if existing:
+@app.post('/user', status_code=201, openapi_extra=json_body_docs(UserCreate))
+async def create_user(user: UserCreate = Depends(json_body(UserCreate)), db=Depends(get_db)):
+     # Check uniqueness of emp_id and emp_email in one query
+     existing_ids = (await db.scalars(select(UserModel.emp_id).where(
+         or_(UserModel.emp_id == user.emp_id, UserModel.emp_email == user.emp_email)
+     ))).all()
+     if user.emp_id in existing_ids:
          raise HTTPException(status_code=400, detail="User with emp_id already exists")
-
-     existing = db.query(UserModel).filter(UserModel.emp_email == user.emp_email).first()
-     if existing:
+     if existing_ids:
          raise HTTPException(status_code=400, detail="User with emp_email already exists")
 
      if user.manager_id:
-         validate_manager_hierarchy(db, user.manager_id, user.emp_designation, user.emp_id)
+         await validate_manager_hierarchy(db, user.manager_id, user.emp_designation, user.emp_id)
 
      db_user = UserModel(
          emp_name=user.emp_name,
@@ -348,71 +518,96 @@ def create_user(user: UserCreate, db=Depends(get_db)):
      )
      db.add(foundation_entry)
      
-     db.commit()
-     db.refresh(db_user)
+     try:
+         await db.commit()
+     except IntegrityError:
+         # Lost a race with a concurrent insert of the same emp_id/emp_email
+         await db.rollback()
+         raise HTTPException(status_code=400, detail="User with emp_id or emp_email already exists")
+     await invalidate_hierarchy_caches()
      logger.info("User created: %s", {
          "id": db_user.id,
          "emp_id": db_user.emp_id,
          "emp_email": db_user.emp_email,
      })
      
-     data = UserRead.from_orm(db_user).dict()
+     data = UserRead.from_orm_trusted(db_user).model_dump()
      return response(status_code=status.HTTP_201_CREATED, message="User created successfully", data=data)
 
 
+async def paginate(db, query, order_column, limit: int, offset: int, after_id=None, row_type=tuple) -> dict:
+    """
+    Runs a list query one page at a time and wraps the rows with the paging info.
+    When after_id is given, seeks past it (keyset) instead of skipping `offset` rows.
+    Each row is built as row_type(*row), so the query's columns must follow row_type's fields.
+    """
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
+    if after_id is not None:
+        query = query.where(order_column > after_id)
+    else:
+        query = query.offset(offset)
+    rows = (await db.execute(query.order_by(order_column).limit(limit))).all()
+    return {
+        "items": [row_type(*row) for row in rows],
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+    }
+
+def list_columns(model, row_type) -> tuple:
+    # Columns in the dataclass's field order, so each result row maps onto it positionally
+    return tuple(getattr(model, field.name) for field in fields(row_type))
+
+# Columns returned by GET /user and GET /tasks, selected as plain rows (no ORM instances)
+USER_LIST_COLUMNS = list_columns(UserModel, UserReadFast)
+TASK_LIST_COLUMNS = list_columns(TaskModel, TaskReadFast)
+
 @app.get('/user')
-def get_users(user_id: Optional[str] = None, db=Depends(get_db)):
+async def get_users(
+    user_id: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    after_id: Optional[int] = None,
+    db=Depends(get_db),
+):
+    query = select(*USER_LIST_COLUMNS)
     if user_id:
         # Check if user exists (optional, but good for validation)
         # root_user = db.query(UserModel).filter(UserModel.emp_id == user_id).first()
         
         # Get all subordinates recursively (naturally excludes the user_id itself)
-        subordinate_ids = get_all_subordinates(db, user_id)
+        subordinate_ids = await get_all_subordinates(db, user_id)
         
-        users = db.query(UserModel).filter(UserModel.emp_id.in_(subordinate_ids)).all()
-    else:
-        # Default behavior: fetch all users (or could be restricted to current_user scope if desired later)
-        users = db.query(UserModel).all()
-
-    data = []
-    for user in users:
-        data.append({
-            "id": user.id,
-            "emp_id": user.emp_id,
-            "emp_email": user.emp_email,
-            "emp_name": user.emp_name,
-            "emp_phone": user.emp_phone,
-            "emp_designation": user.emp_designation,
-            "emp_department": user.emp_department,
-            "emp_hierarchy": user.emp_hierarchy,
-            "manager_id": user.manager_id,
-        })
+        query = query.where(UserModel.emp_id.in_(subordinate_ids))
+    # Default behavior: fetch all users (or could be restricted to current_user scope if desired later)
+
+    data = await paginate(db, query, UserModel.id, limit, offset, after_id, UserReadFast)
     return response(status.HTTP_200_OK, message="Users fetched successfully", data=data)
 
 
-@app.put('/user/{emp_id}', status_code=200)
-def update_user(emp_id: str, user_update: UserUpdate, db=Depends(get_db)):
-    db_user = db.query(UserModel).filter(UserModel.emp_id == emp_id).first()
+@app.put('/user/{emp_id}', status_code=200, openapi_extra=json_body_docs(UserUpdate))
+async def update_user(emp_id: str, user_update: UserUpdate = Depends(json_body(UserUpdate)), db=Depends(get_db)):
+    db_user = await db.scalar(user_by_emp_id(emp_id))
     if not db_user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Validate uniqueness if changing emp_id
-    if user_update.emp_id and user_update.emp_id != emp_id:
-        existing_user = db.query(UserModel).filter(UserModel.emp_id == user_update.emp_id).first()
-        if existing_user:
+    # Validate uniqueness of a changed emp_id and/or emp_email in one query
+    new_emp_id = user_update.emp_id if user_update.emp_id and user_update.emp_id != emp_id else None
+    new_email = user_update.emp_email if user_update.emp_email and user_update.emp_email != db_user.emp_email else None
+    if new_emp_id or new_email:
+        conflicts = (await db.execute(select(UserModel.emp_id, UserModel.emp_email).where(
+            or_(UserModel.emp_id == new_emp_id, UserModel.emp_email == new_email)
+        ))).all()
+        if any(new_emp_id and r.emp_id == new_emp_id for r in conflicts):
             raise HTTPException(status_code=400, detail="New emp_id already exists")
-    
-    # Validate uniqueness if changing emp_email
-    if user_update.emp_email and user_update.emp_email != db_user.emp_email:
-        existing_email = db.query(UserModel).filter(UserModel.emp_email == user_update.emp_email).first()
-        if existing_email:
+        if conflicts:
             raise HTTPException(status_code=400, detail="New emp_email already exists")
 
     # Validate manager if changed
     if user_update.manager_id and user_update.manager_id != db_user.manager_id:
          # Check hierarchy with Current designation (or new if provided)
          designation = user_update.emp_designation or db_user.emp_designation
-         validate_manager_hierarchy(db, user_update.manager_id, designation, db_user.emp_id)
+         await validate_manager_hierarchy(db, user_update.manager_id, designation, db_user.emp_id)
 
     # Update fields if provided
     if user_update.emp_name is not None:
@@ -433,13 +628,13 @@ def update_user(emp_id: str, user_update: UserUpdate, db=Depends(get_db)):
         db_user.manager_id = user_update.manager_id
 
     try:
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=400, detail=f"Database update failed: {str(e)}")
+    await invalidate_hierarchy_caches()
 
-    data = UserRead.from_orm(db_user).dict()
+    data = UserRead.from_orm_trusted(db_user).model_dump()
     # Ensure token is not returned or handled appropriately if needed (usually not needed in update profile response unless refreshed)
     if "token" in data:
         del data["token"]
@@ -447,14 +642,14 @@ def update_user(emp_id: str, user_update: UserUpdate, db=Depends(get_db)):
     return response(status.HTTP_200_OK, message="User updated successfully", data=data)
 
 
-@app.post('/tasks', status_code=201)
-def create_task(task: TaskCreate, db=Depends(get_db), current_user=Depends(verify_token)):
+@app.post('/tasks', status_code=201, openapi_extra=json_body_docs(TaskCreate))
+async def create_task(task: TaskCreate = Depends(json_body(TaskCreate)), db=Depends(get_db), current_user=Depends(verify_token)):
     
     # Generate Task ID if not provided
     if not task.id:
         task.id = secrets.token_hex(8)
 
-    existing = db.query(TaskModel).filter(TaskModel.id == task.id).first()
+    existing = await db.scalar(select(TaskModel.id).where(TaskModel.id == task.id))
     if existing:
         raise HTTPException(status_code=400, detail="Task with this ID already exists")
 
@@ -464,7 +659,7 @@ def create_task(task: TaskCreate, db=Depends(get_db), current_user=Depends(verif
     if not task.task_assigned_to:
         raise HTTPException(status_code=400, detail="Task must be assigned to a user")
 
-    assigned_user = db.query(UserModel).filter(UserModel.emp_id == task.task_assigned_to).first()
+    assigned_user = await db.scalar(user_by_emp_id(task.task_assigned_to))
     if not assigned_user:
         raise HTTPException(status_code=400, detail="Assigned user not found")
     
@@ -488,25 +683,41 @@ def create_task(task: TaskCreate, db=Depends(get_db), current_user=Depends(verif
         task_duration=task.task_duration,
     )
     db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
+    await db.commit()
     
-    data = TaskRead.from_orm(db_task).dict()
+    data = TaskRead.from_orm_trusted(db_task).model_dump()
     return response(status_code=status.HTTP_201_CREATED, message="Task created successfully", data=data)
 
 
+# Value sets TaskCreate enforces, with the default a blank CSV cell takes
+TASK_CHOICE_FIELDS = {
+    "task_status": (get_args(TaskStatus), "todo"),
+    "task_priority": (get_args(TaskPriority), None),
+}
+
 @app.get('/tasks')
-def get_tasks(user_id: Optional[str] = None, db=Depends(get_db), current_user=Depends(verify_token)):
+async def get_tasks(
+    user_id: Optional[str] = None,
+    status_filter: Optional[TaskStatus] = Query(None, alias="status"),
+    priority: Optional[TaskPriority] = None,
+    due_before: Optional[date] = None,
+    limit: int = Query(50, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    after_id: Optional[str] = None,
+    db=Depends(get_db),
+    current_user=Depends(verify_token),
+    current_user_scope=Depends(get_view_scope),
+):
     """
     Get tasks.
     - If user_id is NOT provided: Returns tasks for Current User + Subordinates (if applicable).
     - If user_id IS provided: Returns tasks for Target User + Target User's Subordinates (if applicable).
       (Only if Current User has permission to view Target User).
+    - status / priority / due_before narrow the result; it is returned one page at a time.
     """
     
-    # 1. Determine Access Scope of Current User
+    # 1. Access Scope of Current User (resolved by the get_view_scope dependency)
     # What is the MAX set of users this person is allowed to see data for?
-    current_user_scope = get_user_view_scope(db, current_user.emp_id)
     
     # 2. Determine the Root of the Query
     target_root_id = user_id if user_id else current_user.emp_id
@@ -515,49 +726,48 @@ def get_tasks(user_id: Optional[str] = None, db=Depends(get_db), current_user=De
     # Ensure current user is allowed to view the target root user
     if target_root_id not in current_user_scope:
          # If trying to view someone outside their hierarchy, deny access (return empty)
-         return response(status.HTTP_200_OK, message="Tasks fetched successfully", data=[])
+         data = {"items": [], "total": 0, "limit": limit, "offset": offset}
+         return response(status.HTTP_200_OK, message="Tasks fetched successfully", data=data)
 
     # 4. Calculate the Final Display Scope
     # We want the tree *rooted* at target_root_id
-    display_scope = get_user_view_scope(db, target_root_id)
+    # Viewing their own tree reuses the scope already resolved for the current user
+    if target_root_id == current_user.emp_id:
+        display_scope = current_user_scope
+    else:
+        display_scope = await get_user_view_scope(db, target_root_id)
     
-    query = db.query(TaskModel).filter(TaskModel.task_assigned_to.in_(display_scope))
-
-    tasks = query.all()
-    data = []
-    for task in tasks:
-        data.append({
-            "id": task.id,
-            "task_name": task.task_name,
-            "task_description": task.task_description,
-            "task_status": task.task_status,
-            "task_assigned_to": task.task_assigned_to,
-            "task_assigned_by": task.task_assigned_by,
-            "task_assigned_date": task.task_assigned_date,
-            "task_due_date": task.task_due_date,
-            "task_priority": task.task_priority,
-            "task_tags": task.task_tags,
-            "task_notes": task.task_notes,
-            "task_created_at": task.task_created_at,
-            "task_updated_at": task.task_updated_at,
-            "task_duration": task.task_duration,
-        })
+    query = select(*TASK_LIST_COLUMNS).where(TaskModel.task_assigned_to.in_(display_scope))
+    if status_filter:
+        query = query.where(TaskModel.task_status == status_filter)
+    if priority:
+        query = query.where(TaskModel.task_priority == priority)
+    if due_before:
+        query = query.where(TaskModel.task_due_date < due_before)
+
+    data = await paginate(db, query, TaskModel.id, limit, offset, after_id, TaskReadFast)
     return response(status.HTTP_200_OK, message="Tasks fetched successfully", data=data)
 
 
-@app.put('/tasks/{task_id}')
-def update_task(task_id: str, task: TaskCreate, db=Depends(get_db), current_user=Depends(verify_token)):
-    db_task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+@app.put('/tasks/{task_id}', openapi_extra=json_body_docs(TaskUpdate))
+async def update_task(task_id: str, task: TaskUpdate = Depends(json_body(TaskUpdate)), db=Depends(get_db), current_user=Depends(verify_token)):
+    db_task = await db.scalar(select(TaskModel).where(TaskModel.id == task_id))
     if not db_task:
         raise HTTPException(status_code=404, detail="Task not found")
 
+    # New values must come from the fixed sets; a legacy value already stored on the task may be sent back unchanged
+    for field, (choices, _) in TASK_CHOICE_FIELDS.items():
+        value = getattr(task, field)
+        if value is not None and value not in choices and value != getattr(db_task, field):
+            raise HTTPException(status_code=422, detail=f"{field} must be one of {', '.join(choices)}")
+
     if task.task_duration == "0":
         raise HTTPException(status_code=400, detail="Task duration cannot be 0")
 
     if not task.task_assigned_to:
         raise HTTPException(status_code=400, detail="Task must be assigned to a user")
 
-    assigned_user = db.query(UserModel).filter(UserModel.emp_id == task.task_assigned_to).first()
+    assigned_user = await db.scalar(user_by_emp_id(task.task_assigned_to))
     if not assigned_user:
             raise HTTPException(status_code=400, detail="Assigned user not found")
 
@@ -584,90 +794,142 @@ def update_task(task_id: str, task: TaskCreate, db=Depends(get_db), current_user
     db_task.task_updated_at = task.task_updated_at
     db_task.task_duration = task.task_duration
 
-    db.commit()
-    db.refresh(db_task)
+    await db.commit()
     
-    data = TaskRead.from_orm(db_task).dict()
+    data = TaskRead.from_orm_trusted(db_task).model_dump()
     return response(status_code=status.HTTP_200_OK, message="Task updated successfully", data=data)
 
 
+# Rows written per transaction by the CSV user upload
+UPLOAD_BATCH_SIZE = 1000
+
+def read_csv_upload(file: UploadFile) -> list:
+    """
+    Parses the upload straight off its spooled temp file through a streaming decoder,
+    instead of reading and decoding the whole body in memory first.
+    Falls back to latin-1 (re-reading from the start) when the file is not valid UTF-8.
+    """
+    raw = file.file
+    for encoding in ('utf-8', 'latin-1'):
+        raw.seek(0)
+        # newline='' leaves line splitting to the csv module, which only breaks rows on \r and \n
+        text_file = io.TextIOWrapper(raw, encoding=encoding, newline='')
+        try:
+            return list(csv.DictReader(text_file))
+        except UnicodeDecodeError:
+            continue
+        finally:
+            # Unwrap without closing the spooled file, so the retry (and UploadFile.close) still work
+            text_file.detach()
+
+
 @app.post('/users/upload', status_code=200)
 async def upload_users(file: UploadFile = File(...), db=Depends(get_db)):
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="File must be a CSV")
     
-    content = await file.read()
-    # Decode logic
-    try:
-        decoded = content.decode('utf-8')
-    except UnicodeDecodeError:
-        # Fallback or error
-        decoded = content.decode('latin-1')
-        
-    csv_reader = csv.DictReader(io.StringIO(decoded))
-    
-    added_count = 0
+    rows = read_csv_upload(file)
+
     skipped_count = 0
-    
-    for row in csv_reader:
-        # Basic validation: ensure required user fields exist in CSV row
-        required_cols = ["emp_id", "emp_name", "emp_email"]
-        if any(col not in row for col in required_cols):
-            # If CSV format is bad, maybe fail? or just skip? 
-            # Prompt: "if ther are duplicate users then ignore that and restun success"
-            # It doesn't explicitly say what to do with missing columns, but implies standard 'create users'.
-            # I will skip if key data is missing to avoid error.
-            skipped_count += 1
-            continue
 
+    # Basic validation: ensure required user fields exist in the CSV.
+    # DictReader gives every row the header's keys, so this is checked once on the first row.
+    required_cols = ["emp_id", "emp_name", "emp_email"]
+    if rows and any(col not in rows[0] for col in required_cols):
+        # If CSV format is bad, maybe fail? or just skip? 
+        # Prompt: "if ther are duplicate users then ignore that and restun success"
+        # It doesn't explicitly say what to do with missing columns, but implies standard 'create users'.
+        # I will skip if key data is missing to avoid error.
+        skipped_count = len(rows)
+        rows = []
+
+    # Look up every emp_id/emp_email from the file in one query instead of one per row
+    ids = {row.get("emp_id") for row in rows}
+    emails = {row.get("emp_email") for row in rows}
+    existing = []
+    if rows:
+        existing = (await db.execute(select(UserModel.emp_id, UserModel.emp_email).where(
+            or_(UserModel.emp_id.in_(ids), UserModel.emp_email.in_(emails))
+        ))).all()
+    seen_ids = {r.emp_id for r in existing}
+    seen_emails = {r.emp_email for r in existing}
+
+    new_users = []
+    for row in rows:
         emp_id = row.get("emp_id")
         emp_email = row.get("emp_email")
         
-        existing = db.query(UserModel).filter((UserModel.emp_id == emp_id) | (UserModel.emp_email == emp_email)).first()
-        if existing:
+        # Duplicates against the DB or earlier rows of the same file are skipped
+        if emp_id in seen_ids or emp_email in seen_emails:
             skipped_count += 1
             continue
+        seen_ids.add(emp_id)
+        seen_emails.add(emp_email)
         
-        new_user = UserModel(
-            emp_name=row.get("emp_name"),
-            emp_id=emp_id,
-            emp_email=emp_email,
-            emp_phone=row.get("emp_phone"),
-            emp_designation=row.get("emp_designation"),
-            emp_department=row.get("emp_department"),
-            emp_hierarchy=row.get("emp_hierarchy"),
-            manager_id=row.get("manager_id") # Add CSV support for manager
-        )
-        db.add(new_user)
-        
-        # Create Foundation Entry for CSV User
-        # Default password "123456"
-        foundation_entry = Foundation(
-            emp_id=emp_id,
-            password="123456",
-            token=None
-        )
-        db.add(foundation_entry)
-
-        added_count += 1
+        new_users.append({
+            "emp_name": row.get("emp_name"),
+            "emp_id": emp_id,
+            "emp_email": emp_email,
+            "emp_phone": row.get("emp_phone"),
+            "emp_designation": row.get("emp_designation"),
+            "emp_department": row.get("emp_department"),
+            "emp_hierarchy": row.get("emp_hierarchy"),
+            "manager_id": row.get("manager_id"), # Add CSV support for manager
+        })
+        # Its Foundation entry (default password) is created by bulk_insert_users
     
-    db.commit()
+    # Rows whose manager is missing or doesn't outrank them are skipped; managers may come from the same file.
+    # Skipping a row can orphan rows that named it as manager, so repeat until nothing more is rejected.
+    while True:
+        with_manager = [i for i, u in enumerate(new_users) if u["manager_id"]]
+        if not with_manager:
+            break
+        errors = await validate_manager_hierarchy_batch(
+            db,
+            [(new_users[i]["manager_id"], new_users[i]["emp_designation"], new_users[i]["emp_id"]) for i in with_manager],
+            pending={u["emp_id"]: u["emp_designation"] for u in new_users},
+        )
+        invalid = {i for i, error in zip(with_manager, errors) if error}
+        if not invalid:
+            break
+        new_users = [u for i, u in enumerate(new_users) if i not in invalid]
+        skipped_count += len(invalid)
+
+    # Commit in batches so a large file doesn't build one huge transaction.
+    # Rows a concurrent writer inserted meanwhile are dropped by ON CONFLICT, so count what was actually inserted.
+    added_count = 0
+    for start in range(0, len(new_users), UPLOAD_BATCH_SIZE):
+        end = min(start + UPLOAD_BATCH_SIZE, len(new_users))
+        try:
+            inserted = await bulk_insert_users(db, new_users[start:end], skip_conflicts=True)
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.exception("User upload failed for new users %d-%d", start + 1, end)
+            if added_count:
+                await invalidate_hierarchy_caches()
+            raise HTTPException(status_code=400, detail=f"Database insert failed after {added_count} users were added: {str(e)}")
+        added_count += inserted
+        skipped_count += (end - start) - inserted
+    if added_count:
+        await invalidate_hierarchy_caches()
     return response(status.HTTP_200_OK, message="Bulk upload complete", data={"added": added_count, "skipped": skipped_count})
 
 
+# Task CSV date columns and how each cell is parsed
+TASK_DATE_FIELDS = {
+    "task_assigned_date": date.fromisoformat,
+    "task_due_date": date.fromisoformat,
+    "task_created_at": datetime.fromisoformat,
+    "task_updated_at": datetime.fromisoformat,
+}
+
 @app.post('/tasks/upload', status_code=200)
 async def upload_tasks(file: UploadFile = File(...), db=Depends(get_db), current_user=Depends(verify_token)):
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="File must be a CSV")
 
-    content = await file.read()
-    try:
-        decoded = content.decode('utf-8')
-    except UnicodeDecodeError:
-         decoded = content.decode('latin-1')
-         
-    csv_reader = csv.DictReader(io.StringIO(decoded))
-    rows = list(csv_reader)
+    rows = read_csv_upload(file)
     
     # Pre-validation: "if any issue in format or type then only retun error"
     # We will iterate first to validate, then insert if all good. 
@@ -675,7 +937,21 @@ async def upload_tasks(file: UploadFile = File(...), db=Depends(get_db), current
     # Validating first is safer for "retun error that this field is required".
     
     validated_tasks = []
+
+    # Load every referenced assignee in one query rather than one per row
+    assigned_ids = {row.get("task_assigned_to") for row in rows if row.get("task_assigned_to")}
+    assignees = {
+        u.emp_id: u
+        for u in await db.execute(
+            select(UserModel.emp_id, UserModel.emp_name, UserModel.emp_designation)
+            .where(UserModel.emp_id.in_(assigned_ids))
+        )
+    }
     
+    # Draw random bytes for every row missing an id in one call instead of one per row
+    rand_bytes = secrets.token_bytes(8 * sum(1 for row in rows if not row.get("id")))
+    generated_ids = (rand_bytes[i:i + 8].hex() for i in range(0, len(rand_bytes), 8))
+
     for line_num, row in enumerate(rows, start=1):
         # Validate required fields
         if not row.get("task_name"):
@@ -688,9 +964,24 @@ async def upload_tasks(file: UploadFile = File(...), db=Depends(get_db), current
         if duration == "0":
              raise HTTPException(status_code=400, detail=f"Row {line_num}: task_duration cannot be 0")
 
+        # Dates are stored as DATE/TIMESTAMP columns; blank cells become NULL
+        for field, parse in TASK_DATE_FIELDS.items():
+            value = row.get(field)
+            try:
+                row[field] = parse(value) if value else None
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"Row {line_num}: {field} must be an ISO 8601 date")
+
+        for field, (choices, default) in TASK_CHOICE_FIELDS.items():
+            value = row.get(field)
+            if not value:
+                row[field] = default
+            elif value not in choices:
+                raise HTTPException(status_code=400, detail=f"Row {line_num}: {field} must be one of {', '.join(choices)}")
+
         # Validate Assigned User Existence
         assigned_id = row.get("task_assigned_to")
-        user = db.query(UserModel).filter(UserModel.emp_id == assigned_id).first()
+        user = assignees.get(assigned_id)
         if not user:
             raise HTTPException(status_code=400, detail=f"Row {line_num}: Assigned user '{assigned_id}' not found")
 
@@ -700,45 +991,53 @@ async def upload_tasks(file: UploadFile = File(...), db=Depends(get_db), current
         # ID Handling: If missing, generate.
         task_id = row.get("id")
         if not task_id:
-            task_id = secrets.token_hex(8) # Generate random ID
+            task_id = next(generated_ids) # Generate random ID
             
         validated_tasks.append(dict(row, id=task_id, task_duration=duration))
 
     # All validated, insert them
     count = 0
+    new_tasks = []
     try:
+        # Check ID duplication for the whole file with a single query
+        # If generated, likelihood of collision is low, but checked below.
+        ids = [item["id"] for item in validated_tasks]
+        existing_ids = set(await db.scalars(select(TaskModel.id).where(TaskModel.id.in_(ids))))
+
         for item in validated_tasks:
-            # Check ID duplication logic if ID was provided
-            # If generated, likelihood of collision is low, but checked below.
-            if db.query(TaskModel).filter(TaskModel.id == item["id"]).first():
+            if item["id"] in existing_ids:
                  # Should we fail or skip? "make new api to accept files... if any issue ... return error"
-                 # Duplicate ID is an issue.
+                 # Duplicate ID is an issue (also within the same file).
                  raise HTTPException(status_code=400, detail=f"Task ID {item['id']} already exists")
+            existing_ids.add(item["id"])
             
-            db_task = TaskModel(
-                id=item["id"],
-                task_name=item.get("task_name"),
-                task_description=item.get("task_description"),
-                task_status=item.get("task_status", "todo"),
-                task_assigned_to=item.get("task_assigned_to"),
-                task_assigned_by=item.get("task_assigned_by"),
-                task_assigned_date=item.get("task_assigned_date"),
-                task_due_date=item.get("task_due_date"),
-                task_priority=item.get("task_priority"),
-                task_tags=item.get("task_tags"),
-                task_notes=item.get("task_notes"),
-                task_created_at=item.get("task_created_at"),
-                task_updated_at=item.get("task_updated_at"),
-                task_duration=item.get("task_duration"),
-            )
-            db.add(db_task)
+            new_tasks.append({
+                "id": item["id"],
+                "task_name": item.get("task_name"),
+                "task_description": item.get("task_description"),
+                "task_status": item.get("task_status"),
+                "task_assigned_to": item.get("task_assigned_to"),
+                "task_assigned_by": item.get("task_assigned_by"),
+                "task_assigned_date": item.get("task_assigned_date"),
+                "task_due_date": item.get("task_due_date"),
+                "task_priority": item.get("task_priority"),
+                "task_tags": item.get("task_tags"),
+                "task_notes": item.get("task_notes"),
+                "task_created_at": item.get("task_created_at"),
+                "task_updated_at": item.get("task_updated_at"),
+                "task_duration": item.get("task_duration"),
+            })
             count += 1
-        
-        db.commit()
+
+        if db.bind.dialect.name == "postgresql":
+            # Only this transaction skips waiting on the WAL flush at commit
+            await db.execute(text("SET LOCAL synchronous_commit = OFF"))
+        await bulk_insert(db, TaskModel, new_tasks)
+        await db.commit()
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
 
     return response(status.HTTP_200_OK, message="Bulk upload successful", data={"added": count})
\ No newline at end of file
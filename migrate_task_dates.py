@@ -0,0 +1,54 @@
+from dotenv import load_dotenv
+load_dotenv()
+from datetime import date, datetime
+from sqlalchemy import Date, DateTime, bindparam, inspect, text
+from models import engine
+
+# Task dates used to be stored as String(32); this converts existing columns in place.
+# Values that aren't ISO 8601 (e.g. "02/03/2024") can't be read back as dates, so they are reported and set to NULL.
+DATE_COLUMNS = {
+    "task_assigned_date": ("date", Date(), date.fromisoformat),
+    "task_due_date": ("date", Date(), date.fromisoformat),
+    "task_created_at": ("timestamptz", DateTime(timezone=True), datetime.fromisoformat),
+    "task_updated_at": ("timestamptz", DateTime(timezone=True), datetime.fromisoformat),
+}
+
+def parse_or_none(parse, value):
+    try:
+        return parse(value) if value else None
+    except ValueError:
+        return None
+
+def migrate_task_dates():
+    is_postgres = engine.dialect.name == "postgresql"
+    columns = {c["name"]: c["type"] for c in inspect(engine).get_columns("tasks")}
+    with engine.begin() as conn:
+        for name, (sql_type, column_type, parse) in DATE_COLUMNS.items():
+            if columns[name].python_type is not str:
+                continue
+            rows = conn.execute(text(f"SELECT id, {name} FROM tasks WHERE {name} IS NOT NULL")).all()
+            parsed = [(task_id, value, parse_or_none(parse, value)) for task_id, value in rows]
+            invalid = [(task_id, value) for task_id, value, result in parsed if value and result is None]
+            for task_id, value in invalid:
+                print(f"   tasks {task_id}: {name} {value!r} is not an ISO 8601 date, set to NULL")
+
+            if is_postgres:
+                # Clear what the cast would reject (or read with the server's DateStyle) before changing the type
+                if invalid:
+                    conn.execute(text(f"UPDATE tasks SET {name} = NULL WHERE id = :id"), [{"id": task_id} for task_id, _ in invalid])
+                conn.execute(text(
+                    f"ALTER TABLE tasks ALTER COLUMN {name} TYPE {sql_type} "
+                    f"USING NULLIF({name}, '')::{sql_type}"
+                ))
+            elif parsed:
+                # SQLite keeps the column's declared type; rewrite each value in the format the Date/DateTime column reads
+                conn.execute(
+                    text(f"UPDATE tasks SET {name} = :value WHERE id = :id").bindparams(bindparam("value", type_=column_type)),
+                    [{"id": task_id, "value": result} for task_id, _, result in parsed],
+                )
+            converted = sum(result is not None for _, _, result in parsed)
+            print(f" - tasks.{name} -> {sql_type} ({converted} converted, {len(invalid)} invalid set to NULL)")
+    print("Task date columns migrated.")
+
+if __name__ == "__main__":
+    migrate_task_dates()
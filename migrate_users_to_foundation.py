@@ -1,29 +1,18 @@
-from models import SessionLocal, User, Foundation
+from sqlalchemy import text
+from models import SessionLocal
 
 def migrate_users():
     db = SessionLocal()
     try:
-        users = db.query(User).all()
-        print(f"Found {len(users)} users.")
-        
-        migrated_count = 0
-        for user in users:
-            # Check if foundation exists
-            foundation = db.query(Foundation).filter(Foundation.emp_id == user.emp_id).first()
-            if not foundation:
-                print(f"Creating Foundation entry for {user.emp_id}")
-                new_foundation = Foundation(
-                    emp_id=user.emp_id,
-                    password="123456", # Default password
-                    token=None
-                )
-                db.add(new_foundation)
-                migrated_count += 1
-            else:
-                print(f"Foundation entry already exists for {user.emp_id}")
-        
+        # One INSERT ... SELECT creates the missing Foundation entries (default password) for all users
+        result = db.execute(text(
+            "INSERT INTO foundation (emp_id, password, token) "
+            "SELECT u.emp_id, '123456', NULL FROM users u "
+            "LEFT JOIN foundation f ON f.emp_id = u.emp_id "
+            "WHERE f.emp_id IS NULL"
+        ))
         db.commit()
-        print(f"Migration complete. Created {migrated_count} Foundation entries.")
+        print(f"Migration complete. Created {result.rowcount} Foundation entries.")
     except Exception as e:
         print(f"Error during migration: {e}")
         db.rollback()
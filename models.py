@@ -1,10 +1,13 @@
-from typing import Optional
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import ClassVar, Literal, Optional
 import os
 from dotenv import load_dotenv
-from sqlalchemy import Column, Integer, String, Date
+from sqlalchemy import Column, Integer, String, Date, DateTime, Index
 from sqlalchemy.orm import declarative_base, sessionmaker
-from sqlalchemy import create_engine
-from pydantic import BaseModel
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from pydantic import BaseModel, ConfigDict, field_validator
 
 load_dotenv()
 
@@ -22,10 +25,20 @@ class User(Base):
     emp_designation = Column(String(128), nullable=True)
     emp_department = Column(String(128), nullable=True)
     emp_hierarchy = Column(String(128), nullable=True)
-    manager_id = Column(String(64), nullable=True) # emp_id of the manager
+    manager_id = Column(String(64), nullable=True, index=True) # emp_id of the manager
 
 class Foundation(Base):
     __tablename__ = "foundation"
+    __table_args__ = (
+        # verify_token looks rows up by token; partial since most rows have no active token
+        Index(
+            "idx_foundation_token",
+            "token",
+            unique=True,
+            postgresql_where=text("token IS NOT NULL"),
+            sqlite_where=text("token IS NOT NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     emp_id = Column(String(64), unique=True, nullable=False, index=True) # One-to-one with User.emp_id
@@ -34,7 +47,12 @@ class Foundation(Base):
 
 class Task(Base):
     __tablename__ = "tasks"
-
+    __table_args__ = (
+        # GET /tasks filters by assignee (optionally status) and due date
+        Index("ix_task_assignee_status", "task_assigned_to", "task_status"),
+        Index("ix_task_due_date", "task_due_date"),
+        Index("ix_task_assigned_by", "task_assigned_by"),
+    )
 
     id = Column(String(64), primary_key=True, index=True)
     task_name = Column(String(255), nullable=False)
@@ -42,13 +60,13 @@ class Task(Base):
     task_status = Column(String(64), nullable=True)
     task_assigned_to = Column(String(64), nullable=True)
     task_assigned_by = Column(String(64), nullable=True)
-    task_assigned_date = Column(String(32), nullable=True)
-    task_due_date = Column(String(32), nullable=True)
+    task_assigned_date = Column(Date, nullable=True)
+    task_due_date = Column(Date, nullable=True)
     task_priority = Column(String(32), nullable=True)
     task_tags = Column(String(255), nullable=True)
     task_notes = Column(String(1024), nullable=True)
-    task_created_at = Column(String(32), nullable=True)
-    task_updated_at = Column(String(32), nullable=True)
+    task_created_at = Column(DateTime(timezone=True), nullable=True)
+    task_updated_at = Column(DateTime(timezone=True), nullable=True)
     task_duration = Column(String(32), nullable=True)
 
 # Database engine/session setup
@@ -58,14 +76,102 @@ if not DATABASE_URL:
     # Fallback to SQLite for dev if Postgres URL is not configured
     DATABASE_URL = "sqlite:///./automation_dev.db"
 
+# create_all runs only when RUN_MIGRATIONS=1 (e.g. a one-shot migration job), not on every worker boot.
+# The SQLite dev fallback keeps creating its tables by default.
+RUN_MIGRATIONS = os.getenv("RUN_MIGRATIONS", "1" if DATABASE_URL.startswith("sqlite") else "0") == "1"
+
+# Pool sizing per worker process, read once at import. Each worker can hold up to
+# DB_POOL_SIZE + DB_MAX_OVERFLOW connections, so keep workers * that under max_connections.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+
+def _pool_options(url: str) -> dict:
+    # SQLite is a local file; SQLAlchemy's default pool for it is fine and sizing doesn't apply
+    if url.startswith("sqlite"):
+        return {}
+    return dict(
+        # Sized for concurrent requests; pre_ping/recycle drop dead or stale connections
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_pre_ping=True,
+        pool_recycle=DB_POOL_RECYCLE,
+        # Reuse the most recently returned connection so idle overflow connections time out
+        pool_use_lifo=True,
+    )
+
+def _connect_args(url: str) -> dict:
+    # psycopg 3 prepares a statement server-side once it has run this many times on a connection.
+    # asyncpg already keeps its own per-connection prepared statement cache.
+    if url.startswith("postgresql+psycopg://"):
+        return {"prepare_threshold": int(os.getenv("DB_PREPARE_THRESHOLD", 5))}
+    return {}
+
 engine = create_engine(
-    DATABASE_URL,
-    echo=False,
-    future=True,
+    DATABASE_URL, echo=False, future=True, connect_args=_connect_args(DATABASE_URL), **_pool_options(DATABASE_URL)
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def _async_url(url: str) -> str:
+    # The API runs on an asyncio driver; the sync engine above stays for the CLI scripts
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    for prefix in ("postgresql://", "postgresql+psycopg2://"):
+        if url.startswith(prefix):
+            return url.replace(prefix, "postgresql+asyncpg://", 1)
+    # postgresql+psycopg (psycopg 3) and postgresql+asyncpg are already asyncio-capable
+    return url
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _async_url(DATABASE_URL)
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, echo=False, connect_args=_connect_args(ASYNC_DATABASE_URL), **_pool_options(ASYNC_DATABASE_URL)
+)
+def _sqlite_wal(dbapi_connection, connection_record):
+    # WAL lets readers keep going while a write is in progress; NORMAL syncs at checkpoints instead of every commit
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+for _engine in (engine, async_engine.sync_engine):
+    if _engine.dialect.name == "sqlite":
+        event.listen(_engine, "connect", _sqlite_wal)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    # Objects stay readable after commit, so handlers build responses without a refresh SELECT
+    expire_on_commit=False,
+)
+
+# Build read models from DB rows without re-validating them (set TRUSTED_DB_CONSTRUCT=0 to validate again)
+TRUSTED_DB_CONSTRUCT = os.getenv("TRUSTED_DB_CONSTRUCT", "1") == "1"
+
 # Pydantic schemas
+class ORMRead(BaseModel):
+    # Pydantic v2 ORM mode; model instances passed in again are reused as-is rather than copied/revalidated
+    model_config = ConfigDict(from_attributes=True, revalidate_instances="never")
+
+    _FIELDS: ClassVar[tuple] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._FIELDS = tuple(cls.model_fields)
+
+    @classmethod
+    def from_orm_trusted(cls, obj):
+        """
+        Builds the model from an ORM object loaded from our own database, skipping validation.
+        """
+        if not TRUSTED_DB_CONSTRUCT:
+            return cls.model_validate(obj)
+        return cls.model_construct(**{field: getattr(obj, field) for field in cls._FIELDS})
+
 class UserCreate(BaseModel):
     emp_name: str
     emp_id: str
@@ -77,7 +183,7 @@ class UserCreate(BaseModel):
     manager_id: Optional[str] = None
     password: Optional[str] = None # Optional for now, will default in main logic if missing
 
-class UserRead(BaseModel):
+class UserRead(ORMRead):
     id: int
     emp_name: str
     emp_id: str
@@ -88,44 +194,83 @@ class UserRead(BaseModel):
     emp_hierarchy: Optional[str] = None
     manager_id: Optional[str] = None
 
-    class Config:
-        from_attributes = True  # Pydantic v2 ORM mode
+# "todo" is the default the CSV upload has always written
+TaskStatus = Literal["todo", "New", "InProgress", "Done", "Blocked", "Cancelled"]
+TaskPriority = Literal["Low", "Medium", "High", "Critical"]
 
 class TaskCreate(BaseModel):
     id: Optional[str] = None
     task_name: str
     task_description: Optional[str] = None
+    task_status: Optional[TaskStatus] = None
+    task_assigned_to: Optional[str] = None
+    task_assigned_by: Optional[str] = None
+    task_assigned_date: Optional[date] = None
+    task_due_date: Optional[date] = None
+    task_priority: Optional[TaskPriority] = None
+    task_tags: Optional[str] = None
+    task_notes: Optional[str] = None
+    task_created_at: Optional[datetime] = None
+    task_updated_at: Optional[datetime] = None
+    task_duration: Optional[str] = None
+
+    @field_validator("task_assigned_date", "task_due_date", "task_created_at", "task_updated_at", mode="before")
+    @classmethod
+    def blank_date_to_none(cls, value):
+        # Clients send "" for an unset date; the columns are DATE/TIMESTAMP now, so store NULL
+        return value or None
+
+class TaskUpdate(TaskCreate):
+    # Tasks stored before the value sets existed may hold other values; update_task accepts those unchanged
+    task_status: Optional[str] = None
+    task_priority: Optional[str] = None
+
+class TaskRead(ORMRead):
+    id: str
+    task_name: str
+    task_description: Optional[str] = None
     task_status: Optional[str] = None
     task_assigned_to: Optional[str] = None
     task_assigned_by: Optional[str] = None
-    task_assigned_date: Optional[str] = None
-    task_due_date: Optional[str] = None
+    task_assigned_date: Optional[date] = None
+    task_due_date: Optional[date] = None
     task_priority: Optional[str] = None
     task_tags: Optional[str] = None
     task_notes: Optional[str] = None
-    task_created_at: Optional[str] = None
-    task_updated_at: Optional[str] = None
+    task_created_at: Optional[datetime] = None
+    task_updated_at: Optional[datetime] = None
     task_duration: Optional[str] = None
 
-class TaskRead(BaseModel):
+# Slotted dataclasses for trusted DB rows on list endpoints: no validation, and orjson serializes them natively
+@dataclass(slots=True)
+class UserReadFast:
+    id: int
+    emp_name: str
+    emp_id: str
+    emp_email: str
+    emp_phone: Optional[str] = None
+    emp_designation: Optional[str] = None
+    emp_department: Optional[str] = None
+    emp_hierarchy: Optional[str] = None
+    manager_id: Optional[str] = None
+
+@dataclass(slots=True)
+class TaskReadFast:
     id: str
     task_name: str
     task_description: Optional[str] = None
     task_status: Optional[str] = None
     task_assigned_to: Optional[str] = None
     task_assigned_by: Optional[str] = None
-    task_assigned_date: Optional[str] = None
-    task_due_date: Optional[str] = None
+    task_assigned_date: Optional[date] = None
+    task_due_date: Optional[date] = None
     task_priority: Optional[str] = None
     task_tags: Optional[str] = None
     task_notes: Optional[str] = None
-    task_created_at: Optional[str] = None
-    task_updated_at: Optional[str] = None
+    task_created_at: Optional[datetime] = None
+    task_updated_at: Optional[datetime] = None
     task_duration: Optional[str] = None
 
-    class Config:
-        from_attributes = True  # Pydantic v2 ORM mode
-
 class UserUpdate(BaseModel):
     emp_name: Optional[str] = None
     emp_id: Optional[str] = None
@@ -136,5 +281,79 @@ class UserUpdate(BaseModel):
     emp_hierarchy: Optional[str] = None
     manager_id: Optional[str] = None
 
-def init_db() -> None:
-    Base.metadata.create_all(bind=engine)
+_db_initialized = False
+
+async def init_db() -> None:
+    # create_all inspects every table; once per process is enough
+    global _db_initialized
+    if _db_initialized:
+        return
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    _db_initialized = True
+
+async def check_db_connection() -> None:
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+async def bulk_insert(db, model, rows: list, skip_conflicts: bool = False, returning: Optional[str] = None) -> Optional[list]:
+    """
+    Inserts a list of row dicts for the given model inside the session's transaction.
+    On PostgreSQL the rows are streamed with COPY; with skip_conflicts they go through a
+    temp staging table and rows hitting a unique constraint are dropped (ON CONFLICT DO NOTHING).
+    Other databases fall back to an executemany INSERT.
+    With `returning`, returns that column's values for the rows actually inserted.
+    """
+    inserted = [row[returning] for row in rows] if returning else None
+    if not rows:
+        return inserted
+    if db.bind.dialect.name != "postgresql":
+        await db.execute(insert(model), rows)
+        return inserted
+
+    table = model.__table__.name
+    columns = list(rows[0].keys())
+    column_list = ", ".join(columns)
+    records = [tuple(row.get(col) for col in columns) for row in rows]
+
+    target = table
+    if skip_conflicts:
+        target = f"{table}_stage"
+        # Only the copied columns: column defaults (e.g. nextval for the id) would run for every staged row
+        await db.execute(text(
+            f"CREATE TEMP TABLE {target} ON COMMIT DROP AS SELECT {column_list} FROM {table} WITH NO DATA"
+        ))
+
+    conn = await db.connection()
+    raw = (await conn.get_raw_connection()).driver_connection
+    if hasattr(raw, "copy_records_to_table"):
+        # asyncpg
+        await raw.copy_records_to_table(target, records=records, columns=columns)
+    else:
+        # psycopg 3
+        async with raw.cursor() as cursor:
+            async with cursor.copy(f"COPY {target} ({column_list}) FROM STDIN") as copy:
+                for record in records:
+                    await copy.write_row(record)
+
+    if not skip_conflicts:
+        return inserted
+    result = await db.execute(text(
+        f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {target} ON CONFLICT DO NOTHING"
+        + (f" RETURNING {returning}" if returning else "")
+    ))
+    if returning:
+        inserted = list(result.scalars())
+    await db.execute(text(f"DROP TABLE {target}"))
+    return inserted
+
+async def bulk_insert_users(db, rows: list, skip_conflicts: bool = False) -> int:
+    """
+    Inserts user row dicts plus a Foundation entry (default password "123456") for each user
+    actually inserted, both through bulk_insert. Returns the number of users inserted.
+    """
+    emp_ids = await bulk_insert(db, User, rows, skip_conflicts=skip_conflicts, returning="emp_id")
+    # Users dropped by a conflict get no Foundation row, so no orphan with the default password
+    foundations = [{"emp_id": emp_id, "password": "123456", "token": None} for emp_id in emp_ids]
+    await bulk_insert(db, Foundation, foundations, skip_conflicts=skip_conflicts)
+    return len(emp_ids)
@@ -1,4 +1,6 @@
+import functools
 import redis
+from redis import asyncio as aioredis
 import os
 from dotenv import load_dotenv
 
@@ -6,33 +8,98 @@ load_dotenv()
 
 # Check for REDIS_URL in env, else default
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
-REDIS_PORT = os.getenv("REDIS_PORT", 6379)
-REDIS_DB = os.getenv("REDIS_DB", 0)
+REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
+REDIS_DB = int(os.getenv("REDIS_DB", 0))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", None)
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 32))
+
+# One asyncio client (and connection pool) per process; connections are opened lazily and reused,
+# and cache calls await the socket instead of blocking the event loop
+_client = aioredis.Redis(
+    host=REDIS_HOST,
+    port=REDIS_PORT,
+    db=REDIS_DB,
+    password=REDIS_PASSWORD,
+    decode_responses=True, # String responses instead of bytes
+    max_connections=REDIS_MAX_CONNECTIONS,
+)
 
 def get_redis_client():
+    return _client
+
+async def ping_redis() -> bool:
+    try:
+        return await _client.ping()
+    except redis.ConnectionError as e:
+        print(f"Error connecting to Redis: {e}")
+        return False
+
+def _ignore_connection_errors(default=None):
+    # Cache helpers degrade to a miss / no-op while Redis is unreachable
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except redis.ConnectionError as e:
+                print(f"Error connecting to Redis: {e}")
+                return default() if callable(default) else default
+        return wrapper
+    return decorator
+
+@_ignore_connection_errors()
+async def set_value(key: str, value: str, expiration: int = None):
+    await _client.set(key, value, ex=expiration)
+
+@_ignore_connection_errors()
+async def get_value(key: str):
+    return await _client.get(key)
+
+@_ignore_connection_errors(default=False)
+async def delete_value(key: str) -> bool:
+    # False when Redis was unreachable, so callers can log the key left behind
+    await _client.delete(key)
+    return True
+
+@_ignore_connection_errors(default=set)
+async def get_members(key: str) -> set:
+    return await _client.smembers(key)
+
+@_ignore_connection_errors()
+async def set_members(key: str, members, expiration: int = None):
+    if members:
+        async with _client.pipeline() as pipe:
+            pipe.delete(key)
+            pipe.sadd(key, *members)
+            if expiration:
+                pipe.expire(key, expiration)
+            await pipe.execute()
+
+@_ignore_connection_errors()
+async def delete_matching(pattern: str):
+    keys = [key async for key in _client.scan_iter(match=pattern, count=500)]
+    if keys:
+        await _client.delete(*keys)
+
+@_ignore_connection_errors()
+async def incr_value(key: str):
+    return await _client.incr(key)
+
+@_ignore_connection_errors()
+async def mset_values(mapping: dict, expiration: int = None, raise_on_error: bool = True):
+    # Sends every SET in one round trip (no MULTI); raise_on_error=False for fire-and-forget callers
+    async with _client.pipeline(transaction=False) as pipe:
+        for key, value in mapping.items():
+            pipe.set(key, value, ex=expiration)
+        await pipe.execute(raise_on_error=raise_on_error)
+
+async def mget_values(keys: list) -> list:
+    # Values come back in the same order as keys (None for missing keys, or all None if Redis is down)
     try:
-        r = redis.Redis(
-            host=REDIS_HOST,
-            port=REDIS_PORT,
-            db=REDIS_DB,
-            password=REDIS_PASSWORD,
-            decode_responses=True # String responses instead of bytes
-        )
-        # Test connection
-        r.ping()
-        return r
+        async with _client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.get(key)
+            return await pipe.execute()
     except redis.ConnectionError as e:
         print(f"Error connecting to Redis: {e}")
-        return None
-
-def set_value(key: str, value: str, expiration: int = None):
-    r = get_redis_client()
-    if r:
-        r.set(key, value, ex=expiration)
-
-def get_value(key: str):
-    r = get_redis_client()
-    if r:
-        return r.get(key)
-    return None
+        return [None] * len(keys)
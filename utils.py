@@ -1,15 +1,25 @@
 from typing import Optional, Any
+import orjson
 from fastapi import status
 from fastapi.responses import JSONResponse
 
+# Starlette copies headers into the response, so one shared dict is safe
+_NO_CACHE_HEADERS = {'Cache-Control': 'no-cache'}
+
+
+class ORJSONResponse(JSONResponse):
+    # Serializes with orjson instead of the stdlib json module
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
 
 def response(status_code: int = status.HTTP_400_BAD_REQUEST, message: Optional[str] = None, data: Any = None):
-    if data and isinstance(data, dict) and data.get("error_text"):
-        message = data.get("error_text")
+    if type(data) is dict and (error_text := data.get("error_text")):
+        message = error_text
 
     body = {
         'status': status_code,
         'message': message,
         'data': data
     }
-    return JSONResponse(content=body, status_code=status_code, headers={'Cache-Control': 'no-cache'})
\ No newline at end of file
+    return ORJSONResponse(content=body, status_code=status_code, headers=_NO_CACHE_HEADERS)